@@ -12,7 +12,7 @@ Description:
     The pipeline includes around 20-30 pre-defined functions saved in other files. The scraper performs:
     - Automated date-based search queries
     - Iteration through paginated results
-    - Opening detailed case pages in new tabs
+    - Fetching detailed case pages concurrently over HTTP
     - Extracting main table data and case-level details
     - Writing cleaned, structured data to local CSV files
 
@@ -24,11 +24,24 @@ Description:
         to site dependencies.
 """
 
+import argparse
+import asyncio
+import datetime
+import functools
+import pickle
+from io import BytesIO
+
+import aiohttp
+import pandas as pd
 from bs4 import BeautifulSoup
+from lxml import etree
+from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+import os
 import time
 import random
+from urllib.parse import urlsplit
 
 from selenium.common.exceptions import (
     ElementNotInteractableException,
@@ -46,8 +59,644 @@ st_url = 'https://xxxx/caseSearch.do'
 # Local output path where CSV data is stored
 out_path = "C:/Users/XX/Raw_Data"
 
+# Number of case detail pages fetched concurrently over HTTP
+DETAIL_CONCURRENCY = 64
+
+# Default per-host request budget until the server reports its own limits
+DETAIL_REQUESTS_PER_SECOND = 10.0
+
+# X-RateLimit-Reset values above this are epoch timestamps, not seconds
+RATE_LIMIT_EPOCH_CUTOFF = 1e9
+
+# Longest a host is paused on the server's say-so (seconds)
+MAX_RATE_LIMIT_PAUSE = 3600
+
+# Retry policy for failed detail requests: BACKOFF_BASE * 2**attempt + jitter
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+
+# Minimum spacing between browser-driven requests to the same host
+SELENIUM_MIN_INTERVAL = 1.5
+
+# Time of the last browser-driven request, keyed by host
+last_request_ts = {}
+
+# Output CSVs, appended to in batches
+MAIN_TABLE_PATH = f"{out_path}\\main_table.csv"
+CASE_DETAIL_PATH = f"{out_path}\\case_details.csv"
+HEARING_PATH = f"{out_path}\\hearings.csv"
+SERVICE_PATH = f"{out_path}\\services.csv"
+
+# Rows waiting to be written, flushed together by flush_if()
+PENDING_MAIN = []
+PENDING_DETAIL = []
+PENDING_HEARING = []
+PENDING_SERVICE = []
+
+# Pending rows across all tables that trigger a flush
+FLUSH_THRESHOLD = 1000
+
+# Column order of each output CSV, fixed by its header once written
+CSV_COLUMNS = {}
+
+# Case numbers already collected, loaded once and kept current while scraping
+EXISTING_CASES = set()
+
+# Years searched, and the cached list of their weekday search dates
+SEARCH_YEARS = (2019, 2020, 2021, 2022, 2023, 2024, 2025)
+DATE_BAG_PATH = f"{out_path}\\date_bag.pkl"
+
+
+# -----------------------------------------------------------
+# WebDriver setup
+# -----------------------------------------------------------
+
+def setup_driver(headless=True):
+    """
+    Create a Chrome driver tuned for scraping.
+
+    Images are blocked and pages are handed over as soon as the DOM is
+    ready, since nothing here needs the rendered page.
+
+    Parameters:
+        headless (bool): Run without a visible window. Pass False only to
+            watch the browser while debugging.
+    """
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    options.page_load_strategy = "eager"
+    return webdriver.Chrome(options=options)
+
+
+# -----------------------------------------------------------
+# Detail page parsing (streaming lxml iterparse)
+# -----------------------------------------------------------
+
+# Labels collected from the case summary block
+CASE_DETAIL_LABELS = {
+    "filed_date": "Filed Date:",
+    "case_type": "Case Type:",
+    "debt_type": "Debt Type:",
+    "offense_date": "Offense Date:",
+    "charge": "Charge:",
+    "code_section": "Code Section:",
+    "case_status": "Case Status:",
+}
+
+# Label text -> field name, for every label read from a detail page
+LABEL_FIELDS = {
+    label: key
+    for key, label in {"case_number": "Case Number:", **CASE_DETAIL_LABELS}.items()
+}
+
+# Column title that identifies each result grid -> grid name
+GRID_HEADERS = {
+    "Hearing Type": "hearing",
+    "Service Type": "service",
+}
+
+
+def cell_text(cell):
+    """Whitespace-normalized text of a table cell (like XPath normalize-space)."""
+    return " ".join("".join(cell.itertext()).split())
+
+
+def enclosing_table(tr):
+    """Return the table a row belongs to, looking through thead/tbody/tfoot."""
+    parent = tr.getparent()
+    if parent is not None and parent.tag in ("thead", "tbody", "tfoot"):
+        return parent.getparent()
+    return parent
+
+
+def drop_element(elem):
+    """Remove an element from the tree but keep its tail text in place."""
+    parent = elem.getparent()
+    if parent is None:
+        return
+    if elem.tail:
+        previous = elem.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + elem.tail
+        else:
+            parent.text = (parent.text or "") + elem.tail
+    parent.remove(elem)
+
+
+def stream_detail_page(html_bytes, encoding=None):
+    """
+    Read labelled fields and grid rows from a detail page in one pass.
+
+    Rows are streamed with lxml.etree.iterparse and discarded once read, so
+    only the current row is held in memory rather than the whole DOM.
+
+    A field's value is the cell right after its label cell. A grid starts at
+    the row holding one of GRID_HEADERS and runs over the data rows that
+    follow it in the same table (across thead/tbody/tfoot).
+
+    Parameters:
+        html_bytes (bytes): Raw detail page HTML.
+        encoding (str | None): Encoding of html_bytes; None lets lxml detect
+            it from the document.
+
+    Returns:
+        tuple[dict, dict]: ({field: value}, {grid name: [row dicts]})
+    """
+    fields = {}
+    grids = {name: [] for name in GRID_HEADERS.values()}
+    grid_name, grid_table, columns = None, None, []
+
+    events = etree.iterparse(BytesIO(html_bytes), events=("end",),
+                             tag=("tr", "script", "style"),
+                             html=True, encoding=encoding)
+    for _, tr in events:
+        # lxml already tolerates the broken markup; the only cleanup needed
+        # is keeping script/style text out of the cell values
+        if tr.tag != "tr":
+            drop_element(tr)
+            continue
+
+        cells = [cell_text(c) for c in tr if c.tag in ("td", "th")]
+
+        for label, value in zip(cells, cells[1:]):
+            key = LABEL_FIELDS.get(label)
+            if key is not None and key not in fields:
+                fields[key] = value
+
+        header = next((GRID_HEADERS[c] for c in cells if c in GRID_HEADERS), None)
+        if header is not None:
+            grid_name, grid_table, columns = header, enclosing_table(tr), cells
+        elif grid_name is not None and enclosing_table(tr) is grid_table:
+            if any(c.tag == "td" for c in tr):
+                grids[grid_name].append(dict(zip(columns, cells)))
+        else:
+            grid_name = None
+
+        # Drop the row and everything before it in its table
+        tr.clear()
+        while tr.getprevious() is not None:
+            del tr.getparent()[0]
+
+    return fields, grids
+
+
+def parse_case_details(fields, case_number):
+    """Build the case summary record from the streamed label fields."""
+    info = {"case_number": case_number}
+    for key in CASE_DETAIL_LABELS:
+        info[key] = fields.get(key, "")
+    return info
+
+
+def parse_hearing_info(grids, case_number):
+    """Return the hearing grid rows, tagged with the case number."""
+    return [{**row, "case_number": case_number} for row in grids["hearing"]]
+
+
+def parse_service_info(grids, case_number):
+    """Return the service grid rows, tagged with the case number."""
+    return [{**row, "case_number": case_number} for row in grids["service"]]
+
+
+# -----------------------------------------------------------
+# Search dates
+# -----------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def get_weekdays_in_year_formatted(year):
+    """
+    Return every Monday-Friday date of a year as "MM/DD/YYYY" strings.
+
+    Returns a tuple so the cached value cannot be modified by callers.
+    """
+    day = datetime.date(year, 1, 1)
+    weekdays = []
+    while day.year == year:
+        if day.weekday() < 5:
+            weekdays.append(day.strftime("%m/%d/%Y"))
+        day += datetime.timedelta(days=1)
+    return tuple(weekdays)
+
+
+def load_date_bag(years=SEARCH_YEARS, path=DATE_BAG_PATH):
+    """
+    Return the weekday search dates for the given years.
+
+    The list is pickled to disk on first build, so restarted crawls read it
+    back instead of regenerating it. A cached file for other years is rebuilt.
+    """
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            cached_years, date_bag = pickle.load(f)
+        if cached_years == tuple(years):
+            return date_bag
+
+    date_bag = []
+    for yr in years:
+        date_bag.extend(get_weekdays_in_year_formatted(yr))
+
+    with open(path, "wb") as f:
+        pickle.dump((tuple(years), date_bag), f)
+    return date_bag
+
+
+# -----------------------------------------------------------
+# Buffered CSV output
+# -----------------------------------------------------------
+
+def append_case_main_data(main_page_infos, page_num, court_code, interactable, nrows):
+    """
+    Queue the result-table rows of one search page for writing.
+
+    Parameters:
+        main_page_infos (tuple): (rows, n_links) as returned by parse_main_page,
+            where rows is a list of dicts keyed by column name.
+        page_num (int): Result page index for the current date.
+        court_code (int): Code of the court being scraped.
+        interactable (str): State of the "Next Page" button.
+        nrows (int): Number of case links on the page.
+    """
+    for row in main_page_infos[0]:
+        PENDING_MAIN.append({
+            **row,
+            "page_num": page_num,
+            "court_code": court_code,
+            "interactable": interactable,
+            "nrows": nrows,
+        })
+
+
+def append_case_detail_data(case_detail_info, hearing_info, service_info):
+    """Queue the parsed detail, hearing and service rows of one case."""
+    PENDING_DETAIL.append(case_detail_info)
+    PENDING_HEARING.extend(hearing_info)
+    PENDING_SERVICE.extend(service_info)
+
+
+def csv_columns(path, df):
+    """
+    Return the column order rows appended to path must follow.
+
+    An existing file's header wins; otherwise the first batch sets it.
+    """
+    if path not in CSV_COLUMNS:
+        if os.path.exists(path):
+            CSV_COLUMNS[path] = list(pd.read_csv(path, nrows=0).columns)
+        else:
+            CSV_COLUMNS[path] = list(df.columns)
+    return CSV_COLUMNS[path]
+
+
+def flush_if(threshold=FLUSH_THRESHOLD):
+    """
+    Append all pending rows to their CSVs once at least threshold rows
+    are buffered. Use threshold=0 to flush unconditionally.
+
+    Each batch is aligned to the file's header, so rows whose keys differ
+    in order still land under the right columns. Rows carrying values in
+    columns the header lacks are not dropped: they go to a new
+    "<table>_extra_<ns>.csv" file with their own header, and a warning
+    names it.
+    """
+    pending = (
+        (PENDING_MAIN, MAIN_TABLE_PATH),
+        (PENDING_DETAIL, CASE_DETAIL_PATH),
+        (PENDING_HEARING, HEARING_PATH),
+        (PENDING_SERVICE, SERVICE_PATH),
+    )
+    if sum(len(rows) for rows, _ in pending) < max(threshold, 1):
+        return
+
+    for rows, path in pending:
+        if not rows:
+            continue
+        df = pd.DataFrame.from_records(rows)
+        columns = csv_columns(path, df)
+
+        extra = [c for c in df.columns if c not in columns]
+        if extra:
+            unmatched = df[extra].notna().any(axis=1)
+            root, ext = os.path.splitext(path)
+            extra_path = f"{root}_extra_{time.time_ns()}{ext}"
+            df[unmatched].to_csv(extra_path, index=False)
+            print(f"WARNING: {int(unmatched.sum())} rows with columns {extra} not in "
+                  f"{os.path.basename(path)} written to {extra_path}")
+            df = df[~unmatched]
+
+        df.reindex(columns=columns).to_csv(
+            path, mode="a", header=not os.path.exists(path), index=False
+        )
+        rows.clear()
+
+
+# -----------------------------------------------------------
+# Rate limiting
+# -----------------------------------------------------------
+
+def wait_for_host(url, min_interval=SELENIUM_MIN_INTERVAL):
+    """
+    Sleep only as long as needed to keep browser requests to a host
+    at least min_interval seconds apart.
+    """
+    host = urlsplit(url).netloc
+    elapsed = time.monotonic() - last_request_ts.get(host, float("-inf"))
+    if elapsed < min_interval:
+        time.sleep(min_interval - elapsed)
+    last_request_ts[host] = time.monotonic()
+
 
-def scrape_all_case_pages(driver, max_pages=20):
+class HostRateLimiter:
+    """
+    Token bucket per host for the async fetchers.
+
+    The refill rate starts at DETAIL_REQUESTS_PER_SECOND and is lowered or
+    raised from the server's X-RateLimit-* headers; Retry-After pauses
+    the host outright.
+    """
+
+    def __init__(self, rate=DETAIL_REQUESTS_PER_SECOND, capacity=DETAIL_CONCURRENCY):
+        self.default_rate = rate
+        self.capacity = capacity
+        self.buckets = {}  # host -> [tokens, rate, last refill, paused until]
+        self.locks = {}
+
+    async def acquire(self, host):
+        """Wait until a request to host is allowed, then spend one token."""
+        lock = self.locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = time.monotonic()
+            bucket = self.buckets.setdefault(host, [1.0, self.default_rate, now, now])
+            tokens, rate, last, paused_until = bucket
+
+            tokens = min(self.capacity, tokens + (now - last) * rate)
+            wait = max(paused_until - now, (1.0 - tokens) / rate, 0.0)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                tokens = min(self.capacity, tokens + wait * rate)
+
+            bucket[0] = tokens - 1.0
+            bucket[2] = time.monotonic()
+
+    def update(self, host, headers):
+        """Adjust a host's rate from Retry-After / X-RateLimit-* headers."""
+        now = time.monotonic()
+        bucket = self.buckets.setdefault(host, [1.0, self.default_rate, now, now])
+
+        retry_after = headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            bucket[3] = max(bucket[3], now + int(retry_after))
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        try:
+            remaining, reset = int(remaining), float(reset)
+        except (TypeError, ValueError):
+            return
+
+        # Reset is either seconds from now or an epoch timestamp; a stale
+        # epoch means the window is already over
+        reset_in = reset - time.time() if reset > RATE_LIMIT_EPOCH_CUTOFF else reset
+        reset_in = min(max(reset_in, 0.0), MAX_RATE_LIMIT_PAUSE)
+        if remaining <= 0:
+            bucket[0] = 0.0
+            bucket[3] = max(bucket[3], now + reset_in)
+        elif reset_in > 0:
+            bucket[1] = remaining / reset_in
+
+
+async def fetch_with_backoff(session, limiter, url, max_retries=MAX_RETRIES):
+    """
+    GET url through the host's rate limiter, retrying failures with
+    exponential backoff.
+
+    Returns:
+        tuple[bytes, str | None] | None: Raw response body and the charset from
+            its Content-Type header, or None once the retries are exhausted.
+    """
+    host = urlsplit(url).netloc
+    for attempt in range(max_retries + 1):
+        await limiter.acquire(host)
+        try:
+            async with session.get(url) as resp:
+                limiter.update(host, resp.headers)
+                if 200 <= resp.status < 300:
+                    return await resp.read(), resp.charset
+                print(f"HTTP {resp.status} for {url} (attempt {attempt + 1})")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Failed to fetch {url} (attempt {attempt + 1}): {e}")
+
+        if attempt < max_retries:
+            await asyncio.sleep(BACKOFF_BASE * 2 ** attempt + random.uniform(0, BACKOFF_BASE))
+
+    return None
+
+
+# -----------------------------------------------------------
+# Concurrent detail fetching (aiohttp)
+# -----------------------------------------------------------
+
+def parse_detail_page(page, encoding=None):
+    """
+    Parse one case detail page.
+
+    The page goes straight to the streaming parser; lxml's HTML parser is
+    tolerant enough that no regex normalization pass is needed.
+
+    Parameters:
+        page (bytes | str): Detail page HTML.
+        encoding (str | None): Charset of raw bytes, e.g. from Content-Type;
+            None lets lxml detect it from the document.
+
+    Returns:
+        tuple | None: (case_detail_info, hearing_info, service_info), or None
+            if the page carries no case number (e.g. an error page).
+    """
+    if isinstance(page, bytes):
+        fields, grids = stream_detail_page(page, encoding=encoding)
+    else:
+        fields, grids = stream_detail_page(page.encode("utf-8"), encoding="utf-8")
+
+    case_number = fields.get("case_number", "")
+    if case_number == "":
+        return None
+
+    return (
+        parse_case_details(fields, case_number),
+        parse_hearing_info(grids, case_number),
+        parse_service_info(grids, case_number),
+    )
+
+
+def store_case_details(case_detail_info, hearing_info, service_info):
+    """Queue one parsed case for writing and mark it as collected."""
+    print("Scraping:", case_detail_info["case_number"])
+    append_case_detail_data(case_detail_info, hearing_info, service_info)
+    EXISTING_CASES.add(case_detail_info["case_number"])
+
+
+async def fetch_detail_worker(session, limiter, url_queue, result_queue, failed_urls):
+    """
+    Fetch and parse case detail pages until the URL queue is drained.
+
+    Parsed records are handed to the single writer through result_queue,
+    since the append helpers are not safe to call from several coroutines.
+    URLs that still fail after retries, come back empty or cannot be
+    parsed are collected in failed_urls.
+    """
+    while True:
+        url = await url_queue.get()
+        try:
+            fetched = await fetch_with_backoff(session, limiter, url)
+            if fetched is None or not fetched[0]:
+                failed_urls.append(url)
+                continue
+
+            page_bytes, charset = fetched
+            try:
+                parsed = parse_detail_page(page_bytes, encoding=charset)
+            except (etree.LxmlError, ValueError) as e:
+                print(f"Failed to parse {url}: {e}")
+                failed_urls.append(url)
+                continue
+
+            if parsed is not None:
+                await result_queue.put(parsed)
+        finally:
+            url_queue.task_done()
+
+
+async def write_detail_results(result_queue):
+    """Single consumer that appends parsed case details in arrival order."""
+    while True:
+        item = await result_queue.get()
+        if item is None:
+            break
+
+        store_case_details(*item)
+
+
+async def scrape_case_details(session, limiter, detail_urls, concurrency=DETAIL_CONCURRENCY):
+    """
+    Fetch case detail pages concurrently, reusing the browser's session.
+
+    Parameters:
+        session (aiohttp.ClientSession): Long-lived session carrying the
+            browser's cookies.
+        limiter (HostRateLimiter): Per-host rate state kept across pages.
+        detail_urls (list[str]): Absolute URLs of the case detail pages.
+        concurrency (int): Number of worker tasks sharing the URL queue.
+
+    Returns:
+        list[str]: URLs that could not be fetched over HTTP.
+    """
+    url_queue = asyncio.Queue()
+    result_queue = asyncio.Queue()
+    failed_urls = []
+    for url in detail_urls:
+        url_queue.put_nowait(url)
+
+    writer = asyncio.create_task(write_detail_results(result_queue))
+    workers = [
+        asyncio.create_task(fetch_detail_worker(session, limiter, url_queue, result_queue, failed_urls))
+        for _ in range(min(concurrency, len(detail_urls)))
+    ]
+
+    await url_queue.join()
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+    await result_queue.put(None)
+    await writer
+
+    return failed_urls
+
+
+class DetailFetcher:
+    """
+    Event loop and aiohttp session shared by every results page.
+
+    One instance serves the whole crawl, so open connections are reused
+    from page to page instead of being set up again for each one, and
+    pauses or lowered rates learned from the server's rate-limit headers
+    carry over to the next page.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.session = self.loop.run_until_complete(self.open_session())
+        self.limiter = HostRateLimiter()
+
+    @staticmethod
+    async def open_session():
+        # aiohttp sessions must be created inside the loop that uses them
+        return aiohttp.ClientSession()
+
+    def fetch(self, cookies, detail_urls):
+        """
+        Fetch one page's case details with the browser's current cookies.
+
+        Returns:
+            list[str]: URLs that could not be fetched over HTTP.
+        """
+        self.session.cookie_jar.update_cookies(cookies)
+        return self.loop.run_until_complete(
+            scrape_case_details(self.session, self.limiter, detail_urls)
+        )
+
+    def close(self):
+        """Close the session and its event loop."""
+        self.loop.run_until_complete(self.session.close())
+        self.loop.close()
+
+
+# [case number, absolute URL] of the first link in each data row of the
+# result table, collected in a single WebDriver call
+CASE_LINKS_SCRIPT = """
+return Array.from(document.querySelectorAll('table.tableborder tr'))
+    .slice(1)
+    .map(function (row) {
+        var a = row.querySelector('a[href]');
+        return a && [a.textContent.trim(), a.href];
+    })
+    .filter(Boolean);
+"""
+
+
+# In-page fetch that shares the browser's cookies; the last argument is the
+# callback Selenium injects for execute_async_script.
+BROWSER_FETCH_SCRIPT = """
+var done = arguments[arguments.length - 1];
+fetch(arguments[0], {credentials: 'include'})
+    .then(function (r) { return r.ok ? r.text() : null; })
+    .then(done, function () { done(null); });
+"""
+
+
+def fetch_in_browser(driver, url):
+    """
+    Fetch a page through the browser's own fetch(), without opening a tab.
+
+    Used as a fallback for detail pages the HTTP client could not load.
+
+    Returns:
+        str | None: Page HTML, or None on failure.
+    """
+    try:
+        return driver.execute_async_script(BROWSER_FETCH_SCRIPT, url)
+    except WebDriverException as e:
+        print(f"Browser fetch failed for {url}: {e}")
+        return None
+
+
+def scrape_all_case_pages(driver, fetcher, max_pages=20, headless=True):
     """
     Main workflow to scrape case records across multiple dates.
 
@@ -55,15 +704,18 @@ def scrape_all_case_pages(driver, max_pages=20):
         1. Generate a list of weekday search dates.
         2. Loop through each date and submit a search query.
         3. For each date, loop through paginated results (up to 100 pages).
-        4. Open each case link in a new tab and extract:
+        4. Fetch each case link concurrently over HTTP and extract:
             - Case summary data
             - Hearing information
             - Service information
-        5. Save data to CSV after each page.
+        5. Buffer rows in memory and append them to the CSVs once
+           FLUSH_THRESHOLD rows are pending, and again at shutdown.
 
     Parameters:
         driver (selenium.webdriver): Browser automation driver.
+        fetcher (DetailFetcher): Shared HTTP session for case detail pages.
         max_pages (int): Max number of pages to attempt per date.
+        headless (bool): Whether the reinitialized driver runs headless.
     """
 
     # test codes:
@@ -77,13 +729,17 @@ def scrape_all_case_pages(driver, max_pages=20):
 
     driver.switch_to.window(main_page_handle)
 
-    # Reinitialize driver (non-headless for reliability)
-    driver = setup_driver(headless=False)
+    # Reinitialize driver
+    driver = setup_driver(headless=headless)
 
     # Create a unified list of all weekday dates across multiple years
-    date_bag = []
-    for yr in [2019, 2020, 2021, 2022, 2023, 2024, 2025]:
-        date_bag.extend(get_weekdays_in_year_formatted(yr))
+    date_bag = load_date_bag()
+
+    # Load collected case IDs once; the set is updated as cases are scraped
+    if os.path.exists(MAIN_TABLE_PATH):
+        EXISTING_CASES.update(
+            pd.read_csv(MAIN_TABLE_PATH, usecols=['case_number'])['case_number'].astype(str)
+        )
 
     # ------------------------------
     # Main date loop
@@ -95,12 +751,9 @@ def scrape_all_case_pages(driver, max_pages=20):
         driver.switch_to.window(main_page_handle)
 
         # Submit search request for the given date
+        wait_for_host(st_url)
         submit_date_search(driver, date_code)
 
-        # Load existing case IDs if main_table exists
-        if pd.io.common.file_exists(f"{out_path}\\main_table.csv"):
-            existing_cases = pd.read_csv(f"{out_path}\\main_table.csv")['case_number'].values
-
         # Identify which court we are currently scraping
         header_court_name = driver.find_element(By.ID, "headerCourtName")
         court_code = 43 if header_court_name.text == "Chesterfield General District Court " else 999
@@ -110,12 +763,6 @@ def scrape_all_case_pages(driver, max_pages=20):
         # ------------------------------
         for page in range(100):
 
-            # Fresh dataframes for each page
-            case_info_df = pd.DataFrame()
-            hearing_df = pd.DataFrame()
-            service_df = pd.DataFrame()
-            main_df = pd.DataFrame()
-
             print(f"Processing search result page {page}...")
 
             driver.switch_to.window(main_page_handle)
@@ -129,8 +776,8 @@ def scrape_all_case_pages(driver, max_pages=20):
                 except (WebDriverException, StaleElementReferenceException, NoSuchElementException):
                     time.sleep(1)
 
-            # Parse table via BeautifulSoup
-            table_soup = BeautifulSoup(table_html, "html.parser")
+            # Parse table via BeautifulSoup (lxml builder for speed)
+            table_soup = BeautifulSoup(table_html, "lxml")
             main_page_infos = parse_main_page(table_soup)
 
             n_links = main_page_infos[1]
@@ -147,35 +794,34 @@ def scrape_all_case_pages(driver, max_pages=20):
                 interactable=interactable,
                 nrows=n_links
             )
-            save_main_data()
 
             # ------------------------------
-            # Open detailed case pages
+            # Collect detailed case pages
             # ------------------------------
-            links = table_soup.find_all("tr")[1:]
-            n_additional_tabs = 0
+            # Read case links from the live DOM in one round-trip, with retries
+            case_links = []
+            for _ in range(10):
+                try:
+                    case_links = driver.execute_script(CASE_LINKS_SCRIPT)
+                    break
+                except (WebDriverException, StaleElementReferenceException, NoSuchElementException):
+                    time.sleep(1)
 
-            for link in links:
-                link_tag = link.find("a")
-                if not link_tag:
+            detail_urls = []
+            for case_number, full_url in case_links:
+                if not case_number:
                     continue
 
-                case_number = link_tag.text.strip()
-                relative_url = link_tag["href"]
-
                 # Skip cases already collected
-                if case_number in existing_cases:
+                if case_number in EXISTING_CASES:
                     print(f'{case_number} skipped (already collected).')
                     continue
 
-                # Open case detail in new tab
-                full_url = "https://eapps.courts.state.va.us/gdcourts/" + relative_url
-                driver.execute_script("window.open(arguments[0]);", full_url)
-                time.sleep(random.uniform(0.1, 0.5))
-                n_additional_tabs += 1
+                detail_urls.append(full_url)
 
-            # If no new tabs were opened, try to move to next page
-            if len(driver.window_handles) < 2:
+            # If there is nothing new on this page, try to move to next page
+            if not detail_urls:
+                wait_for_host(st_url)
                 result = handle_next_button()
                 if result == 'break':
                     break
@@ -184,33 +830,29 @@ def scrape_all_case_pages(driver, max_pages=20):
             # ------------------------------
             # Scrape each detailed page
             # ------------------------------
-            for handle in driver.window_handles[1:]:
-                driver.switch_to.window(handle)
-
-                cleaned_html = normalize_html(driver.page_source)
-                detail_soup = BeautifulSoup(cleaned_html, "html.parser")
-
-                case_number = get_text_after_label(detail_soup, "Case Number:")
-
-                if rate_limit() or case_number == "":
-                    driver.close()
+            # Selenium only drives the search form; detail pages are plain
+            # GETs that reuse the browser's session cookies.
+            cookies = {c["name"]: c["value"] for c in driver.get_cookies()}
+            failed_urls = fetcher.fetch(cookies, detail_urls)
+
+            # Retry what the HTTP client could not load from inside the page
+            for full_url in failed_urls:
+                wait_for_host(full_url)
+                page_html = fetch_in_browser(driver, full_url)
+                if not page_html:
                     continue
+                try:
+                    parsed = parse_detail_page(page_html)
+                except (etree.LxmlError, ValueError) as e:
+                    print(f"Failed to parse {full_url}: {e}")
+                    continue
+                if parsed is not None:
+                    store_case_details(*parsed)
 
-                # Extract details
-                case_detail_info = parse_case_details(detail_soup, case_number)
-                hearing_info = parse_hearing_info(detail_soup, case_number)
-                service_info = parse_service_info(detail_soup, case_number)
-
-                print("Scraping:", case_number)
-                append_case_detail_data(case_detail_info, hearing_info, service_info)
-
-                # Close detail tab
-                driver.close()
-                time.sleep(0.1)
-
-            # Save all case detail data before navigating
-            save_case_detail_data()
+            # Write buffered rows once enough have accumulated
+            flush_if()
 
+            wait_for_host(st_url)
             result = handle_next_button()
             if result == 'break':
                 break
@@ -227,10 +869,21 @@ if __name__ == "__main__":
     Entry point for running the scraper end-to-end.
     Note:
         - This will launch a Selenium browser session.
+        - Pass --show-browser to watch the browser while debugging.
     """
+    parser = argparse.ArgumentParser(description="Scrape court case records.")
+    parser.add_argument("--show-browser", action="store_true",
+                        help="run Chrome with a visible window (debugging)")
+    args = parser.parse_args()
+    headless = not args.show_browser
+
+    fetcher = None
     try:
-        # Initialize driver (set headless=True if running on server)
-        driver = setup_driver(headless=False)
+        # Initialize driver
+        driver = setup_driver(headless=headless)
+
+        # One HTTP session for every case detail page of the crawl
+        fetcher = DetailFetcher()
 
         # Navigate to the main search page
         driver.get(st_url)
@@ -240,12 +893,18 @@ if __name__ == "__main__":
         main_page_handle = driver.current_window_handle
 
         # Execute full scraping pipeline
-        scrape_all_case_pages(driver)
+        scrape_all_case_pages(driver, fetcher, headless=headless)
 
     except Exception as e:
         print(f"An error occurred during execution: {e}")
 
     finally:
+        # Write whatever is still buffered, even on Ctrl+C
+        flush_if(threshold=0)
+
+        if fetcher is not None:
+            fetcher.close()
+
         # Always close the browser session cleanly
         try:
             driver.quit()
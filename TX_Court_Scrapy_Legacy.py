@@ -16,10 +16,10 @@ NOTE
 
 Description
 -----------
-A simple web crawler that drives Internet Explorer (via Selenium), opens a
-Texas court reporting URL for each (county, year, month) combination, triggers
-an AutoIt script to save the exported Excel report, and renames the downloaded
-files to meaningful names.
+A simple web crawler that requests a Texas court reporting URL for each
+(county, year, month) combination and saves the exported Excel report
+directly under a meaningful file name. The report export is a plain HTTP
+endpoint, so no browser or GUI automation is needed.
 
 Usage
 -----
@@ -27,37 +27,28 @@ Usage
 
 Requirements
 -----------
-    - selenium
+    - httpx[http2]
     - pandas
-    - AutoIt (external executable invoked via subprocess)
 """
 
 import os
 import re
-import glob
-import time
-import subprocess
+import sqlite3
+import multiprocessing
 
+import httpx
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.ie.service import Service
 
 # ---------------------------------------------------------------------------
 # Configuration / Paths
 # ---------------------------------------------------------------------------
 
-# Path to IE WebDriver (IE is deprecated; this is kept for historical reasons)
-IE_DRIVER_PATH = r"C:\ProgramData\anaconda3\Lib\site-packages\IEDriverServer.exe"
-
-# AutoIt script that clicks through the browser UI and saves the XLS file
-AUTOIT_SCRIPT_PATH = r"C:\Users\PycharmProjects\TexasCourt\save_xls.exe"
-
-# Initial URL to "warm up" the driver
-INITIAL_URL = "https://www.google.com/"
-
-# Default download directory for the browser
+# Directory the reports are saved into
 DOWNLOAD_PATH = r"C:\Users\46798566\Downloads"
 
+# Task list and per-report status, so an interrupted crawl can resume
+PROGRESS_DB_PATH = os.path.join(DOWNLOAD_PATH, "progress.sqlite")
+
 # County list file (must contain columns like CT (name) and ID (numeric ID))
 COUNTY_LIST_PATH = r"C:\Users\46798566\PycharmProjects\TexasCourt\County_list.xlsx"
 
@@ -66,65 +57,86 @@ COUNTY_LIST_PATH = r"C:\Users\46798566\PycharmProjects\TexasCourt\County_list.xl
 #   ID: county numeric ID (1-based index used by the website)
 COUNTY_LIST = pd.read_excel(COUNTY_LIST_PATH)
 
+# Plain-dict lookups between county ID and name, so the hot paths avoid pandas
+ID_TO_NAME = dict(zip(COUNTY_LIST.ID, COUNTY_LIST.CT))
+NAME_TO_ID = {v: k for k, v in ID_TO_NAME.items()}
+
+# Report type crawled by the main loop
+CASE_USED = "DSC_Felony_Activity_Detail_N"
+
+# Parses 'DSC_Felony_Activity_Detail_N-<CountyName>-YYYY-MM.xls'
+MISSED_NAME_RE = re.compile(r"DSC_Felony_Activity_Detail_N-(.*)-(\d{4})-(\d{2})\.xls")
+
+# Number of parallel download processes for the first pass
+N_WORKERS = 8
+
+# Timeout (seconds) for a single report request
+REQUEST_TIMEOUT = 30
+
+# Connection pool per HTTP client. Each process downloads one report at a
+# time, so one kept-alive connection (plus a spare) is all it can use; the
+# point is reusing it so each download skips the TLS handshake
+HTTP_LIMITS = httpx.Limits(max_connections=2, max_keepalive_connections=2)
+
+# Per-process HTTP client, created by init_worker() when the pool starts
+WORKER_SESSION = None
+
 
 # ---------------------------------------------------------------------------
-# WebDriver setup
+# HTTP client setup
 # ---------------------------------------------------------------------------
 
-def create_driver():
-    """
-    Create and return an IE WebDriver instance with "eager" page load strategy.
-
-    NOTE: IE / IE driver are deprecated technologies. This function is kept
-    here to show how the original pipeline worked.
-    """
-    service = Service(IE_DRIVER_PATH)
-    options = webdriver.IeOptions()
-    options.page_load_strategy = "eager"
-    options.attach_to_edge_chrome = True  # IE mode in Edge
-    driver = webdriver.Ie(service=service, options=options)
-    driver.set_page_load_timeout(2.5)
-    return driver
+def create_session() -> httpx.Client:
+    """Create a pooled HTTP/2 client for report downloads."""
+    return httpx.Client(http2=True, timeout=REQUEST_TIMEOUT, limits=HTTP_LIMITS,
+                        follow_redirects=True)
 
 
 # ---------------------------------------------------------------------------
 # Core helper functions
 # ---------------------------------------------------------------------------
 
-def get_y_download(driver, url_use: str) -> None:
+def get_y_download(session: httpx.Client, url_use: str, target_path: str) -> bool:
     """
-    Open a URL with the webdriver and call the AutoIt script to save the report.
+    Download the exported report at url_use straight to target_path.
 
     Parameters
     ----------
-    driver : selenium.webdriver
-        Active Selenium WebDriver instance.
+    session : httpx.Client
+        Client used for the request (carries cookies, if any).
     url_use : str
-        Full report URL to open.
+        Full report URL, including the export parameter.
+    target_path : str
+        Final path of the XLS file.
+
+    Returns
+    -------
+    bool
+        True if the report was saved, False otherwise.
 
     Notes
     -----
-    - This uses an external AutoIt script that interacts with the browser GUI.
-    - Timeout is deliberately short to avoid hanging.
+    - The body is written to "<target>.partial" first and then moved into
+      place, so an interrupted download never looks like a finished file.
     """
     try:
-        driver.get(url_use)
-    except Exception as e:
-        print(f"Error loading page: {e}")
+        resp = session.get(url_use)
+        resp.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"Error downloading report: {e}")
+        return False
 
+    partial_path = target_path + ".partial"
     try:
-        print("AutoIt STARTS, do NOT move the mouse/keyboard...")
-        result = subprocess.run(AUTOIT_SCRIPT_PATH, timeout=1.5)
-        print("AutoIt ENDS (for now)")
-
-        if result.returncode != 0:
-            print("AutoIt script failed with exit code", result.returncode)
-        else:
-            print("Download handled successfully")
-    except subprocess.TimeoutExpired:
-        print("AutoIt script timed out.")
-    except Exception as e:
-        print(f"Error running AutoIt script: {e}")
+        with open(partial_path, "wb") as f:
+            f.write(resp.content)
+        os.replace(partial_path, target_path)
+    except OSError as e:
+        print(f"Error saving {target_path}: {e}")
+        return False
+
+    print(f"Saved {os.path.basename(target_path)}")
+    return True
 
 
 def url_generate(mm: int,
@@ -185,7 +197,7 @@ def new_file_name(mm: int,
     -------
     DSC_Felony_Activity_Detail_N-Travis-2016-12.xls
     """
-    county_name = COUNTY_LIST.CT[countyID - 1]
+    county_name = ID_TO_NAME[countyID]
     month_str = f"{mm:02d}"
     year_str = str(yyyy)
 
@@ -193,51 +205,6 @@ def new_file_name(mm: int,
     return nname
 
 
-def rename_downloaded_file(nname: str,
-                           case: str = "DSC_Felony_Activity_Detail_N") -> None:
-    """
-    Rename the raw downloaded XLS file to the standardized filename.
-
-    Parameters
-    ----------
-    nname : str
-        New file name to use.
-    case : str
-        Case type, used to determine the original filename pattern.
-    """
-    if case == "DSC_Felony_Activity_Detail_N":
-        sname = "District_and_Statutory_County_Court_DSC_Felony_Activity_Detail_N.rpt.xls"
-    else:
-        print(f"Unhandled case type in rename_downloaded_file: {case}")
-        return
-
-    old_name = os.path.join(DOWNLOAD_PATH, sname)
-    new_name = os.path.join(DOWNLOAD_PATH, nname)
-
-    try:
-        os.rename(old_name, new_name)
-        print(f"File successfully renamed to {nname}")
-    except FileNotFoundError:
-        print("Downloaded file not found, could not rename.")
-    except Exception as e:
-        print(f"Error renaming file: {e}")
-
-
-def partial_file_removal() -> None:
-    """
-    Remove any *.partial files left in the download folder.
-
-    These are typically leftover artifacts from interrupted downloads.
-    """
-    partial_files = glob.glob(os.path.join(DOWNLOAD_PATH, "*.partial"))
-    for file_path in partial_files:
-        try:
-            os.remove(file_path)
-            print(f"{file_path} has been deleted successfully.")
-        except Exception as e:
-            print(f"Error deleting {file_path}: {e}")
-
-
 def regenerate_names_based_on_missing_names(missed: str):
     """
     Given a missing filename, extract (county, year, month, countyID).
@@ -253,8 +220,7 @@ def regenerate_names_based_on_missing_names(missed: str):
     tuple | None
         (county, year, month, countyID) or None if pattern does not match.
     """
-    pattern = r"^DSC_Felony_Activity_Detail_N-(.*)-(\d{4})-(\d{2})\.xls$"
-    match = re.search(pattern, missed)
+    match = MISSED_NAME_RE.fullmatch(missed)
 
     if not match:
         print("The filename does not match the expected pattern:", missed)
@@ -265,65 +231,145 @@ def regenerate_names_based_on_missing_names(missed: str):
     month = match.group(3)
 
     try:
-        countyID = COUNTY_LIST.loc[COUNTY_LIST["CT"] == county, "ID"].iloc[0]
-    except IndexError:
+        countyID = NAME_TO_ID[county]
+    except KeyError:
         print(f"County '{county}' not found in COUNTY_LIST.")
         return None
 
     return county, year, month, int(countyID)
 
 
+# ---------------------------------------------------------------------------
+# Progress tracking
+# ---------------------------------------------------------------------------
+
+def open_progress_db(path: str = PROGRESS_DB_PATH) -> sqlite3.Connection:
+    """
+    Open (and create if needed) the progress database.
+
+    Each row is one report: its filename, URL, and a status of
+    'pending', 'done' or 'missing'.
+    """
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS progress ("
+        "nname TEXT PRIMARY KEY, countyID INTEGER, year INTEGER, month INTEGER, "
+        "url TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending')"
+    )
+    return conn
+
+
+def seed_progress_db(conn: sqlite3.Connection,
+                     county_ids, years, months,
+                     case: str = CASE_USED) -> None:
+    """
+    Add the (county, year, month) work list to the progress table.
+
+    Runs on every start: tasks already in the table keep their status, and
+    tasks from widened county/year/month ranges are added. Any task not yet
+    'done' whose report is already in DOWNLOAD_PATH (e.g. saved just before
+    a crash, or before the database existed) is marked 'done' so it is not
+    downloaded again.
+    """
+    # One directory scan instead of a stat call per (county, year, month)
+    downloaded = {entry.name for entry in os.scandir(DOWNLOAD_PATH)}
+
+    rows = []
+    for countyID in county_ids:
+        for y in years:
+            for m in months:
+                url_use = url_generate(m, y, countyID=countyID, case=case)
+                if url_use is None:
+                    continue
+                nname = new_file_name(m, y, countyID=countyID, case=case)
+                status = "done" if nname in downloaded else "pending"
+                rows.append((nname, countyID, y, m, url_use, status))
+
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO progress VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+        unfinished = conn.execute("SELECT nname FROM progress WHERE status != 'done'")
+        on_disk = [(nname,) for (nname,) in unfinished if nname in downloaded]
+        conn.executemany("UPDATE progress SET status = 'done' WHERE nname = ?", on_disk)
+
+
+def mark_progress(conn: sqlite3.Connection, nname: str, saved: bool) -> None:
+    """Record the outcome of one download."""
+    with conn:
+        conn.execute("UPDATE progress SET status = ? WHERE nname = ?",
+                     ("done" if saved else "missing", nname))
+
+
+# ---------------------------------------------------------------------------
+# Parallel workers
+# ---------------------------------------------------------------------------
+
+def init_worker() -> None:
+    """Pool initializer: give each worker process its own HTTP client."""
+    global WORKER_SESSION
+    WORKER_SESSION = create_session()
+
+
+def download_one(task: tuple[str, str]) -> tuple[str, bool]:
+    """
+    Download a single pending report.
+
+    Parameters
+    ----------
+    task : tuple[str, str]
+        (filename, url) as stored in the progress database.
+
+    Returns
+    -------
+    tuple[str, bool]
+        (filename, saved)
+    """
+    nname, url_use = task
+    print("Downloading", nname)
+    return nname, get_y_download(WORKER_SESSION, url_use,
+                                 os.path.join(DOWNLOAD_PATH, nname))
+
+
 # ---------------------------------------------------------------------------
 # Main crawling logic
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    case_used = "DSC_Felony_Activity_Detail_N"
-    MISSING_FILES: list[str] = []
-
+    case_used = CASE_USED
+
+    # Example ranges: counties 1–254, years 2011–2023, months 1–12
+    years = range(2011, 2024)
+    months = range(1, 13)
+
+    # Reruns keep existing statuses and pick up whatever is still pending
+    conn = open_progress_db()
+    seed_progress_db(conn, range(1, 255), years, months, case=case_used)
+    tasks = conn.execute(
+        "SELECT nname, url FROM progress WHERE status = 'pending' ORDER BY rowid"
+    ).fetchall()
+
+    # One task per dispatch so each result is recorded as soon as it lands;
+    # only this process writes the db
+    pool = multiprocessing.Pool(processes=N_WORKERS, initializer=init_worker)
+    pool_closed = False
     try:
-        driver = create_driver()
-        driver.get(INITIAL_URL)
-
-        # Example ranges: counties 1–254, years 2011–2023, months 1–12
-        for countyID_used in range(1, 255):
-            for y in range(2011, 2024):
-                for m in range(1, 13):
-                    nname = new_file_name(m, y, countyID=countyID_used, case=case_used)
-                    full_path = os.path.join(DOWNLOAD_PATH, nname)
-
-                    # Skip if we already have this file
-                    if os.path.exists(full_path):
-                        continue
-
-                    print(
-                        "Month", m,
-                        "Year", y,
-                        "at", COUNTY_LIST.CT[countyID_used - 1],
-                        "County, ID:", countyID_used,
-                    )
-
-                    url_use = url_generate(m, y, countyID=countyID_used, case=case_used)
-                    if url_use is None:
-                        continue
-
-                    get_y_download(driver, url_use)
-                    rename_downloaded_file(nname, case=case_used)
-                    time.sleep(2)
-
-                    # Check if rename/download was successful
-                    if not os.path.exists(full_path):
-                        partial_file_removal()
-                        MISSING_FILES.append(nname)
-
+        for nname, saved in pool.imap_unordered(download_one, tasks, chunksize=1):
+            mark_progress(conn, nname, saved)
+        pool.close()
+        pool_closed = True
     except Exception as e:
         print(f"An error occurred in the main loop: {e}")
     finally:
-        try:
-            driver.quit()
-            print("WebDriver closed.")
-        except Exception:
-            pass
+        # Also reached on Ctrl+C: stop the workers before joining them
+        if not pool_closed:
+            pool.terminate()
+        pool.join()
+        print("Worker pool closed.")
+
+    # Includes misses left over from earlier runs
+    MISSING_FILES: list[str] = [
+        row[0] for row in conn.execute("SELECT nname FROM progress WHERE status = 'missing'")
+    ]
 
     # -----------------------------------------------------------------------
     # Second pass: retry downloads for missing files
@@ -333,14 +379,11 @@ if __name__ == "__main__":
 
     # If there are no missing files, nothing to do.
     if MISSING_FILES:
-        driver = create_driver()
+        session = create_session()
 
         try:
             for MISSED in MISSING_FILES:
                 missed_path = os.path.join(DOWNLOAD_PATH, MISSED)
-                if os.path.exists(missed_path):
-                    # Already downloaded in the meantime
-                    continue
 
                 x = regenerate_names_based_on_missing_names(MISSED)
                 if x is None:
@@ -357,29 +400,22 @@ if __name__ == "__main__":
                     SECOND_MISSING_LIST.append(MISSED)
                     continue
 
-                get_y_download(driver, url_use)
-
                 nname = new_file_name(month_int, year_int, countyID=countyID, case=case_used)
-                if nname == MISSED:
-                    rename_downloaded_file(nname, case=case_used)
-                    time.sleep(2.5)
-                else:
+                if nname != MISSED:
                     SECOND_MISSING_LIST.append(nname)
                     continue
 
-                final_path = os.path.join(DOWNLOAD_PATH, nname)
-                if not os.path.exists(final_path):
-                    partial_file_removal()
+                saved = get_y_download(session, url_use, missed_path)
+                mark_progress(conn, nname, saved)
+                if not saved:
                     SECOND_MISSING_LIST.append(nname)
 
         except Exception as e:
             print(f"An error occurred in the second pass: {e}")
         finally:
-            try:
-                driver.quit()
-                print("WebDriver closed for second pass.")
-            except Exception:
-                pass
+            session.close()
+
+    conn.close()
 
     print("First missing list length:", len(MISSING_FILES))
     print("Second missing list length:", len(SECOND_MISSING_LIST))
\ No newline at end of file